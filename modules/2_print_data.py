@@ -1,5 +1,7 @@
 """Module to retrieve and display information about a product in the database."""
 
+import argparse
+
 import load_django
 from parser_app.models import Product
 from pprint import pprint
@@ -32,8 +34,37 @@ def display_product_info(product: Product) -> None:
     pprint(product_data, sort_dicts=False, width=200)
 
 
+def display_product_list() -> None:
+    """
+    Display a short summary line for every product in the database.
+
+    Only the summary columns are loaded, so the photos and specifications
+    columns are never fetched or deserialized. Callers that need everything
+    except those columns can use ``Product.objects.defer('photos', 'specifications')``.
+    """
+    products = Product.objects.only(
+        'title', 'regular_price', 'discount_price', 'product_code'
+    ).order_by('pk').iterator(chunk_size=500)
+
+    found = False
+    for product in products:
+        found = True
+        print(f"{product.product_code} | {product.title} | {product.regular_price} | {product.discount_price}")
+
+    if not found:
+        print("No products found in the database.")
+
+
 def main() -> None:
-    """Get and display information about the first product in the database."""
+    """Get and display information about the first product, or a summary of all products with --list."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--list', action='store_true', help="Display a short summary of all products.")
+    args = parser.parse_args()
+
+    if args.list:
+        display_product_list()
+        return
+
     product = Product.objects.first()
 
     if product: